@@ -47,19 +47,26 @@ extract_version_from_file() {
     local file="$1"
     local version=""
     
-    # Try multiple patterns for version extraction
-    # Pattern 1: Bash style "# Version: 1.0.0"
-    version=$(grep -m1 -i "^# Version:" "$file" 2>/dev/null | sed 's/^# Version:[[:space:]]*//' | awk '{print $1}' | tr -d '[:space:]')
-    
-    # Pattern 2: Python docstring style "Version: 1.0.56 - ..."
-    if [ -z "$version" ]; then
-        version=$(grep -m1 -i "^Version:" "$file" 2>/dev/null | sed 's/^Version:[[:space:]]*//' | awk '{print $1}' | tr -d '[:space:]')
-    fi
-    
-    # Pattern 3: VERSION = "1.0.0" or __version__ = "1.0.0"
-    if [ -z "$version" ]; then
-        version=$(grep -m1 -iE "^(VERSION|__version__)[[:space:]]*=" "$file" 2>/dev/null | sed 's/.*=[[:space:]]*["'"'"']//' | sed 's/["'"'"'].*//' | tr -d '[:space:]')
-    fi
+    # Single pass over the file; the first line matching each pattern wins,
+    # and patterns are tried in priority order:
+    #   1. Bash style "# Version: 1.0.0"
+    #   2. Python docstring style "Version: 1.0.56 - ..."
+    #   3. VERSION = "1.0.0" or __version__ = "1.0.0"
+    version=$(LC_ALL=C awk '
+        { line = tolower($0) }
+        !seen1 && line ~ /^# version:/ {
+            seen1 = 1; split(substr($0, 11), w, " "); v1 = w[1]
+            if (v1 != "") exit
+        }
+        !seen2 && line ~ /^version:/ {
+            seen2 = 1; split(substr($0, 9), w, " "); v2 = w[1]
+        }
+        !seen3 && line ~ /^(version|__version__)[ \t]*=/ {
+            seen3 = 1; v = $0; sub(/^[^=]*=/, "", v); gsub(/["\047]/, " ", v)
+            split(v, w, " "); v3 = w[1]
+        }
+        END { print (v1 != "" ? v1 : (v2 != "" ? v2 : v3)) }
+    ' "$file" 2>/dev/null)
     
     # Fallback: use file modification date
     if [ -z "$version" ]; then
@@ -89,11 +96,6 @@ extract_description_from_file() {
     echo "$description"
 }
 
-get_permissions() {
-    local file="$1"
-    stat -c "%a" "$file"
-}
-
 generate_manifest() {
     local source_dir="$1"
     local output_file="$2"
@@ -107,37 +109,44 @@ generate_manifest() {
     echo -e "${GREEN}[INFO]${NC} Channel:  $channel"
     echo ""
     
+    # One JSON object per line, slurped into the files array at the end
     local temp_files="/tmp/manifest-files-$$.json"
-    echo "[]" > "$temp_files"
+    : > "$temp_files"
     
     local file_count=0
+    local files=()
+    local file
     
-    # Find all files in source directory
-    while IFS= read -r -d '' file; do
-        # Skip certain files
-        local basename=$(basename "$file")
-        case "$basename" in
-            *.pyc|*.pyo|__pycache__|.git*|*.swp|*.bak|.DS_Store)
-                continue
-                ;;
-        esac
-        
-        # Skip __pycache__ directories
-        if [[ "$file" == *"__pycache__"* ]]; then
-            continue
-        fi
-        
+    # Find all files in source directory. The skip rules are evaluated by
+    # find itself: __pycache__ trees are pruned without being descended
+    # into, and editor/VCS/bytecode files are filtered by name.
+    mapfile -d '' files < <(find "$source_dir" \
+        -name __pycache__ -prune -o \
+        -type f \
+        ! -name '*.pyc' ! -name '*.pyo' ! -name '.git*' \
+        ! -name '*.swp' ! -name '*.bak' ! -name '.DS_Store' \
+        -print0 | sort -z)
+    
+    # Hash in batches of 64 files, one sha256sum per CPU core at a time
+    # (-z: NUL-terminated records, file names are not escaped). Results are
+    # keyed by path, so the order they come back in does not matter.
+    local -A checksums=()
+    local record
+    if [ ${#files[@]} -gt 0 ]; then
+        while IFS= read -r -d '' record; do
+            checksums["${record:66}"]="${record:0:64}"
+        done < <(printf '%s\0' "${files[@]}" | xargs -0 -n 64 -P "$(nproc)" sha256sum -z)
+    fi
+    
+    for file in "${files[@]}"; do
         # Get relative path
         local rel_path="${file#$source_dir/}"
         
-        # Calculate checksum
-        local sha256=$(sha256sum "$file" | cut -d' ' -f1)
+        local sha256="${checksums[$file]}"
         
-        # Get file size
-        local size=$(stat -c "%s" "$file")
-        
-        # Get permissions
-        local permissions=$(get_permissions "$file")
+        # Get file size and permissions (one stat call)
+        local size permissions
+        read -r size permissions < <(stat -c "%s %a" "$file")
         
         # Get file version (with error handling)
         local file_version
@@ -147,34 +156,35 @@ generate_manifest() {
         local description
         description=$(extract_description_from_file "$file") || description=""
         
-        # Escape special characters for JSON
-        description=$(echo "$description" | sed 's/\\/\\\\/g' | sed 's/"/\\"/g' | sed 's/\t/ /g' | tr -d '\n\r')
+        # jq --arg does the JSON escaping; just flatten tabs and CRs
+        description="${description//$'\t'/ }"
+        description="${description//$'\r'/}"
         
         echo -e "  ${BLUE}[SCAN]${NC} $rel_path (v$file_version)"
         
-        # Add to JSON array using jq with proper error handling
-        if ! jq --arg path "$rel_path" \
+        # Append the entry as one line (no rewrite of the entries so far)
+        if ! jq -n -c \
+           --arg path "$rel_path" \
            --arg version "$file_version" \
            --arg sha256 "$sha256" \
            --argjson size "$size" \
            --arg permissions "$permissions" \
            --arg description "$description" \
-           '. += [{
+           '{
                "path": $path,
                "version": $version,
                "sha256": $sha256,
                "size": $size,
                "permissions": $permissions,
                "description": $description
-           }]' "$temp_files" > "${temp_files}.tmp" 2>/dev/null; then
+           }' >> "$temp_files" 2>/dev/null; then
             echo -e "  ${YELLOW}[WARN]${NC} Failed to add $rel_path to manifest, skipping..."
             continue
         fi
         
-        mv "${temp_files}.tmp" "$temp_files"
         file_count=$((file_count + 1))
         
-    done < <(find "$source_dir" -type f -print0 | sort -z)
+    done
     
     echo ""
     echo -e "${GREEN}[INFO]${NC} Found $file_count files"
@@ -197,9 +207,11 @@ generate_manifest() {
             "channel": $channel,
             "release_date": $release_date,
             "base_url": $base_url,
-            "files": $files[0]
-        }' > "$output_file"
+            "files": $files
+        }' > "${output_file}.tmp"
     
+    # Replace the old manifest in one step so readers never see a partial file
+    mv "${output_file}.tmp" "$output_file"
     rm -f "$temp_files"
     
     echo -e "${GREEN}[INFO]${NC} Manifest created: $output_file"